@@ -34,11 +34,21 @@ the following sub-packages (e.g. `gammapy.spectrum`):
 
 __all__ = ["__version__", "song"]
 
-import pkg_resources
+try:
+    from importlib.metadata import PackageNotFoundError as _PackageNotFoundError
+    from importlib.metadata import version as _version
+except ImportError:
+    # Python < 3.8, importlib.metadata is not available
+    from pkg_resources import DistributionNotFound as _PackageNotFoundError
+    from pkg_resources import get_distribution as _get_distribution
+
+    def _version(name):
+        return _get_distribution(name).version
+
 
 try:
-    __version__ = pkg_resources.get_distribution(__name__).version
-except pkg_resources.DistributionNotFound:
+    __version__ = _version(__name__)
+except _PackageNotFoundError:
     # package is not installed
     pass
 
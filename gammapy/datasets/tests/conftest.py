@@ -0,0 +1,25 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import astropy.units as u
+from gammapy.irf import EffectiveAreaTable2D, EnergyDependentMultiGaussPSF, PSFMap
+
+
+@pytest.fixture(scope="session")
+def aeff():
+    filename = (
+        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
+    )
+    return EffectiveAreaTable2D.read(filename, hdu="EFFECTIVE AREA")
+
+
+@pytest.fixture(scope="session")
+def psf_map():
+    filename = (
+        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
+    )
+    psf = EnergyDependentMultiGaussPSF.read(filename, hdu="POINT SPREAD FUNCTION")
+
+    table_psf = psf.to_energy_dependent_table_psf(
+        theta=u.Quantity(0.5, u.deg, copy=False)
+    )
+    return PSFMap.from_energy_dependent_table_psf(table_psf)
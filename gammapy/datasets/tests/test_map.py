@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from functools import lru_cache
+from operator import attrgetter
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -7,12 +9,7 @@ from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
 from gammapy.data import GTI
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff
-from gammapy.irf import (
-    EDispMap,
-    EffectiveAreaTable2D,
-    EnergyDependentMultiGaussPSF,
-    PSFMap,
-)
+from gammapy.irf import EDispMap
 from gammapy.makers.utils import make_map_exposure_true_energy
 from gammapy.maps import Map, MapAxis, WcsGeom, WcsNDMap
 from gammapy.modeling import Fit
@@ -26,7 +23,7 @@ from gammapy.modeling.models import (
 from gammapy.utils.testing import mpl_plot_check, requires_data, requires_dependency
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def geom():
     axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=2)
     return WcsGeom.create(
@@ -38,7 +35,7 @@ def geom():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def geom_etrue():
     axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=3, name="energy_true")
     return WcsGeom.create(
@@ -50,21 +47,20 @@ def geom_etrue():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def geom_image():
-    ebounds_true = np.logspace(-1.0, 1.0, 2)
-    axis = MapAxis.from_edges(ebounds_true, name="energy", unit=u.TeV, interp="log")
+    axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=1)
     return WcsGeom.create(
         skydir=(0, 0), binsz=0.02, width=(2, 2), frame="galactic", axes=[axis]
     )
 
 
-def get_exposure(geom_etrue):
-    filename = (
-        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
-    )
-    aeff = EffectiveAreaTable2D.read(filename, hdu="EFFECTIVE AREA")
+@pytest.fixture
+def bkg_map(geom):
+    return Map.from_geom(geom, data=np.full(geom.data_shape, 0.2))
 
+
+def get_exposure(geom_etrue, aeff):
     exposure_map = make_map_exposure_true_energy(
         pointing=SkyCoord(1, 0.5, unit="deg", frame="galactic"),
         livetime="1 hour",
@@ -74,21 +70,13 @@ def get_exposure(geom_etrue):
     return exposure_map
 
 
-def get_psf():
-    filename = (
-        "$GAMMAPY_DATA/cta-1dc/caldb/data/cta/1dc/bcf/South_z20_50h/irf_file.fits"
-    )
-    psf = EnergyDependentMultiGaussPSF.read(filename, hdu="POINT SPREAD FUNCTION")
-
-    table_psf = psf.to_energy_dependent_table_psf(theta=0.5 * u.deg)
-    psf_map = PSFMap.from_energy_dependent_table_psf(table_psf)
-    return psf_map
-
-
 @pytest.fixture
 def sky_model():
     spatial_model = GaussianSpatialModel(
-        lon_0="0.2 deg", lat_0="0.1 deg", sigma="0.2 deg", frame="galactic"
+        lon_0=u.Quantity(0.2, u.deg, copy=False),
+        lat_0=u.Quantity(0.1, u.deg, copy=False),
+        sigma=u.Quantity(0.2, u.deg, copy=False),
+        frame="galactic",
     )
     spectral_model = PowerLawSpectralModel(
         index=3, amplitude="1e-11 cm-2 s-1 TeV-1", reference="1 TeV"
@@ -96,15 +84,24 @@ def sky_model():
     return SkyModel(spatial_model=spatial_model, spectral_model=spectral_model)
 
 
-def get_map_dataset(sky_model, geom, geom_etrue, edisp=True, name="test", **kwargs):
+@lru_cache()
+def get_mask_fit(geom, lon, lat, frame, radius):
+    """Circular fit mask, cached per geom and circle parameters"""
+    center = SkyCoord(lon, lat, unit="deg", frame=frame)
+    circle = CircleSkyRegion(center=center, radius=u.Quantity(radius, u.deg))
+    return geom.region_mask([circle])
+
+
+def get_map_dataset(
+    sky_model, geom, geom_etrue, aeff, psf_map, edisp=True, name="test", **kwargs
+):
     """Returns a MapDatasets"""
     # define background model
     m = Map.from_geom(geom)
-    m.quantity = 0.2 * np.ones(m.data.shape)
+    m.quantity = np.full(m.data.shape, 0.2)
     background_model = BackgroundModel(m, datasets_names=[name])
 
-    psf = get_psf()
-    exposure = get_exposure(geom_etrue)
+    exposure = get_exposure(geom_etrue, aeff)
 
     if edisp:
         # define energy dispersion
@@ -115,14 +112,15 @@ def get_map_dataset(sky_model, geom, geom_etrue, edisp=True, name="test", **kwar
 
     # define fit mask
     center = sky_model.spatial_model.position
-    circle = CircleSkyRegion(center=center, radius=1 * u.deg)
-    mask_fit = background_model.map.geom.region_mask([circle])
-    mask_fit = Map.from_geom(geom, data=mask_fit)
+    mask_fit = get_mask_fit(
+        geom, center.data.lon.deg, center.data.lat.deg, center.frame.name, 1
+    )
+    mask_fit = WcsNDMap(geom, data=mask_fit.copy())
 
     return MapDataset(
         models=[sky_model, background_model],
         exposure=exposure,
-        psf=psf,
+        psf=psf_map,
         edisp=edisp,
         mask_fit=mask_fit,
         name=name,
@@ -131,8 +129,8 @@ def get_map_dataset(sky_model, geom, geom_etrue, edisp=True, name="test", **kwar
 
 
 @requires_data()
-def test_map_dataset_str(sky_model, geom, geom_etrue):
-    dataset = get_map_dataset(sky_model, geom, geom_etrue)
+def test_map_dataset_str(sky_model, geom, geom_etrue, aeff, psf_map):
+    dataset = get_map_dataset(sky_model, geom, geom_etrue, aeff, psf_map)
     dataset.counts = dataset.npred()
     dataset.mask_safe = dataset.mask_fit
     assert "MapDataset" in str(dataset)
@@ -144,28 +142,26 @@ def test_map_dataset_str(sky_model, geom, geom_etrue):
 
 
 @requires_data()
-def test_fake(sky_model, geom, geom_etrue):
+def test_fake(sky_model, geom, geom_etrue, aeff, psf_map):
     """Test the fake dataset"""
-    dataset = get_map_dataset(sky_model, geom, geom_etrue)
+    dataset = get_map_dataset(sky_model, geom, geom_etrue, aeff, psf_map)
     npred = dataset.npred()
     assert np.all(npred.data >= 0)  # npred must be positive
     dataset.counts = npred
-    real_dataset = dataset.copy()
     dataset.fake(314)
 
-    assert real_dataset.counts.data.shape == dataset.counts.data.shape
-    assert_allclose(real_dataset.counts.data.sum(), 9525.755807)
+    assert npred.data.shape == dataset.counts.data.shape
+    assert_allclose(npred.data.sum(), 9525.755807)
     assert_allclose(dataset.counts.data.sum(), 9723)
 
 
 @pytest.mark.xfail
 @requires_data()
-def test_different_exposure_unit(sky_model, geom):
-    dataset_ref = get_map_dataset(sky_model, geom, geom, edisp=False)
+def test_different_exposure_unit(sky_model, geom, aeff, psf_map):
+    dataset_ref = get_map_dataset(sky_model, geom, geom, aeff, psf_map, edisp=False)
     npred_ref = dataset_ref.npred()
 
-    ebounds_true = np.logspace(2, 4, 3)
-    axis = MapAxis.from_edges(ebounds_true, name="energy", unit="GeV", interp="log")
+    axis = MapAxis.from_energy_bounds("100 GeV", "10000 GeV", nbin=2)
     geom_gev = WcsGeom.create(
         skydir=(266.40498829, -28.93617776),
         binsz=0.02,
@@ -174,23 +170,31 @@ def test_different_exposure_unit(sky_model, geom):
         axes=[axis],
     )
 
-    dataset = get_map_dataset(sky_model, geom, geom_gev, edisp=False)
+    dataset = get_map_dataset(sky_model, geom, geom_gev, aeff, psf_map, edisp=False)
     npred = dataset.npred()
 
     assert_allclose(npred.data[0, 50, 50], npred_ref.data[0, 50, 50])
 
 
 @requires_data()
-def test_to_spectrum_dataset(sky_model, geom, geom_etrue):
-    dataset_ref = get_map_dataset(sky_model, geom, geom_etrue, edisp=True)
+def test_to_spectrum_dataset(sky_model, geom, geom_etrue, aeff, psf_map):
+    dataset_ref = get_map_dataset(
+        sky_model, geom, geom_etrue, aeff, psf_map, edisp=True
+    )
 
     dataset_ref.counts = dataset_ref.background_model.map * 0.0
     dataset_ref.counts.data[1, 50, 50] = 1
     dataset_ref.counts.data[1, 60, 50] = 1
 
-    gti = GTI.create([0 * u.s], [1 * u.h], reference_time="2010-01-01T00:00:00")
+    gti = GTI.create(
+        u.Quantity([0], u.s, copy=False),
+        u.Quantity([1], u.h, copy=False),
+        reference_time="2010-01-01T00:00:00",
+    )
     dataset_ref.gti = gti
-    on_region = CircleSkyRegion(center=geom.center_skydir, radius=0.05 * u.deg)
+    on_region = CircleSkyRegion(
+        center=geom.center_skydir, radius=u.Quantity(0.05, u.deg, copy=False)
+    )
     spectrum_dataset = dataset_ref.to_spectrum_dataset(on_region)
     spectrum_dataset_corrected = dataset_ref.to_spectrum_dataset(
         on_region, containment_correction=True
@@ -210,29 +214,34 @@ def test_to_spectrum_dataset(sky_model, geom, geom_etrue):
     )
 
 
-@requires_data()
-def test_to_image(geom):
+@pytest.fixture(scope="session")
+def fermi_maps():
+    path = "$GAMMAPY_DATA/fermi-3fhl-gc/"
+    return {
+        "counts": Map.read(path + "fermi-3fhl-gc-counts-cube.fits.gz"),
+        "background": Map.read(path + "fermi-3fhl-gc-background-cube.fits.gz"),
+        "exposure": Map.read(path + "fermi-3fhl-gc-exposure-cube.fits.gz"),
+    }
 
-    counts = Map.read("$GAMMAPY_DATA/fermi-3fhl-gc/fermi-3fhl-gc-counts-cube.fits.gz")
-    background = Map.read(
-        "$GAMMAPY_DATA/fermi-3fhl-gc/fermi-3fhl-gc-background-cube.fits.gz"
-    )
-    background = BackgroundModel(background, datasets_names=["fermi"])
 
-    exposure = Map.read(
-        "$GAMMAPY_DATA/fermi-3fhl-gc/fermi-3fhl-gc-exposure-cube.fits.gz"
-    )
-    exposure = exposure.sum_over_axes(keepdims=True)
+@requires_data()
+def test_to_image_fermi_cube(fermi_maps):
+    background = BackgroundModel(fermi_maps["background"], datasets_names=["fermi"])
+    exposure = fermi_maps["exposure"].sum_over_axes(keepdims=True)
     dataset = MapDataset(
-        counts=counts, models=[background], exposure=exposure, name="fermi"
+        counts=fermi_maps["counts"],
+        models=[background],
+        exposure=exposure,
+        name="fermi",
     )
     dataset_im = dataset.to_image()
     assert dataset_im.mask_safe is None
     assert dataset_im.counts.data.sum() == dataset.counts.data.sum()
     assert_allclose(dataset_im.background_model.map.data.sum(), 28548.625, rtol=1e-5)
 
-    ebounds = np.logspace(-1.0, 1.0, 3)
-    axis = MapAxis.from_edges(ebounds, name="energy", unit=u.TeV, interp="log")
+
+def test_to_image_mask_handling():
+    axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=2)
     geom = WcsGeom.create(
         skydir=(0, 0), binsz=0.5, width=(1, 1), frame="icrs", axes=[axis]
     )
@@ -263,15 +272,19 @@ def test_to_image(geom):
 
 
 @requires_data()
-def test_map_dataset_fits_io(tmp_path, sky_model, geom, geom_etrue):
-    dataset = get_map_dataset(sky_model, geom, geom_etrue)
+def test_map_dataset_fits_io(tmp_path, sky_model, geom, geom_etrue, aeff, psf_map):
+    dataset = get_map_dataset(sky_model, geom, geom_etrue, aeff, psf_map)
     dataset.counts = dataset.npred()
     dataset.mask_safe = dataset.mask_fit
-    gti = GTI.create([0 * u.s], [1 * u.h], reference_time="2010-01-01T00:00:00")
+    gti = GTI.create(
+        u.Quantity([0], u.s, copy=False),
+        u.Quantity([1], u.h, copy=False),
+        reference_time="2010-01-01T00:00:00",
+    )
     dataset.gti = gti
 
     hdulist = dataset.to_hdulist()
-    actual = [hdu.name for hdu in hdulist]
+    actual = list(map(attrgetter("name"), hdulist))
 
     desired = [
         "PRIMARY",
@@ -340,15 +353,27 @@ def test_map_dataset_fits_io(tmp_path, sky_model, geom, geom_etrue):
 @requires_dependency("iminuit")
 @requires_dependency("matplotlib")
 @requires_data()
-def test_map_fit(sky_model, geom, geom_etrue):
+def test_map_fit(sky_model, geom, geom_etrue, aeff, psf_map):
     dataset_1 = get_map_dataset(
-        sky_model, geom, geom_etrue, evaluation_mode="local", name="test-1"
+        sky_model,
+        geom,
+        geom_etrue,
+        aeff,
+        psf_map,
+        evaluation_mode="local",
+        name="test-1",
     )
     dataset_1.background_model.norm.value = 0.5
     dataset_1.counts = dataset_1.npred()
 
     dataset_2 = get_map_dataset(
-        sky_model, geom, geom_etrue, evaluation_mode="global", name="test-2"
+        sky_model,
+        geom,
+        geom_etrue,
+        aeff,
+        psf_map,
+        evaluation_mode="global",
+        name="test-2",
     )
     dataset_2.counts = dataset_2.npred()
 
@@ -386,9 +411,9 @@ def test_map_fit(sky_model, geom, geom_etrue):
     assert_allclose(pars[11].error, 0.02147, rtol=1e-2)
 
     # test mask_safe evaluation
-    mask_safe = geom.energy_mask(emin=1 * u.TeV)
-    dataset_1.mask_safe = Map.from_geom(geom, data=mask_safe)
-    dataset_2.mask_safe = Map.from_geom(geom, data=mask_safe)
+    mask_safe = geom.energy_mask(emin=u.Quantity(1, u.TeV, copy=False))
+    dataset_1.mask_safe = WcsNDMap(geom, data=mask_safe)
+    dataset_2.mask_safe = WcsNDMap(geom, data=mask_safe)
 
     stat = fit.datasets.stat_sum()
     assert_allclose(stat, 14824.282955)
@@ -405,11 +430,11 @@ def test_map_fit(sky_model, geom, geom_etrue):
 
 @requires_dependency("iminuit")
 @requires_data()
-def test_map_fit_one_energy_bin(sky_model, geom_image):
+def test_map_fit_one_energy_bin(sky_model, geom_image, aeff, psf_map):
     energy_axis = geom_image.get_axis_by_name("energy")
     geom_etrue = geom_image.to_image().to_cube([energy_axis.copy(name="energy_true")])
 
-    dataset = get_map_dataset(sky_model, geom_image, geom_etrue)
+    dataset = get_map_dataset(sky_model, geom_image, geom_etrue, aeff, psf_map)
     sky_model.spectral_model.index.value = 3.0
     sky_model.spectral_model.index.frozen = True
     dataset.background_model.norm.value = 0.5
@@ -441,16 +466,12 @@ def test_map_fit_one_energy_bin(sky_model, geom_image):
     assert_allclose(pars["amplitude"].error, 8.127593e-14, rtol=1e-2)
 
 
-def test_create(geom, geom_etrue):
+def test_create():
     # tests empty datasets created
     migra_axis = MapAxis(nodes=np.linspace(0.0, 3.0, 51), unit="", name="migra")
     rad_axis = MapAxis(nodes=np.linspace(0.0, 1.0, 51), unit="deg", name="theta")
-    e_reco = MapAxis.from_edges(
-        np.logspace(-1.0, 1.0, 3), name="energy", unit=u.TeV, interp="log"
-    )
-    e_true = MapAxis.from_edges(
-        np.logspace(-1.0, 1.0, 4), name="energy_true", unit=u.TeV, interp="log"
-    )
+    e_reco = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=2)
+    e_true = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=3, name="energy_true")
     geom = WcsGeom.create(binsz=0.02, width=(2, 2), axes=[e_reco])
     empty_dataset = MapDataset.create(
         geom=geom, energy_axis_true=e_true, migra_axis=migra_axis, rad_axis=rad_axis
@@ -467,78 +488,79 @@ def test_create(geom, geom_etrue):
     assert empty_dataset.edisp.exposure_map.data.shape == (3, 1, 10, 10)
     assert_allclose(empty_dataset.edisp.edisp_map.data.sum(), 300)
 
-    assert_allclose(empty_dataset.gti.time_delta, 0.0 * u.s)
+    assert_allclose(empty_dataset.gti.time_delta.to_value("s"), 0.0)
 
 
 @requires_data()
-def test_stack(geom, geom_etrue):
-    m = Map.from_geom(geom)
-    m.quantity = 0.2 * np.ones(m.data.shape)
+def test_stack(geom, geom_etrue, aeff, bkg_map):
     background_model1 = BackgroundModel(
-        m, name="dataset-1-bkg", datasets_names=["dataset-1"]
+        bkg_map, name="dataset-1-bkg", datasets_names=["dataset-1"]
     )
     c_map1 = Map.from_geom(geom)
-    c_map1.quantity = 0.3 * np.ones(c_map1.data.shape)
-    mask1 = np.ones(m.data.shape, dtype=bool)
-    mask1[0][0][0:10] = False
-    mask1 = Map.from_geom(geom, data=mask1)
+    c_map1.quantity = np.full(c_map1.data.shape, 0.3)
+    mask1 = np.ones(geom.data_shape, dtype=bool)
+    mask1[0, 0, 0:10] = False
+    mask1 = WcsNDMap(geom, data=mask1)
 
     dataset1 = MapDataset(
         counts=c_map1,
         models=[background_model1],
-        exposure=get_exposure(geom_etrue),
+        exposure=get_exposure(geom_etrue, aeff),
         mask_safe=mask1,
         name="dataset-1",
     )
 
     c_map2 = Map.from_geom(geom)
-    c_map2.quantity = 0.1 * np.ones(c_map2.data.shape)
+    c_map2.quantity = np.full(c_map2.data.shape, 0.1)
     background_model2 = BackgroundModel(
-        m, norm=0.5, name="dataset-2-bkg", datasets_names=["dataset-2"]
+        bkg_map, norm=0.5, name="dataset-2-bkg", datasets_names=["dataset-2"]
     )
-    mask2 = np.ones(m.data.shape, dtype=bool)
-    mask2[0][3] = False
-    mask2 = Map.from_geom(geom, data=mask2)
+    mask2 = np.ones(geom.data_shape, dtype=bool)
+    mask2[0, 3] = False
+    mask2 = WcsNDMap(geom, data=mask2)
 
     dataset2 = MapDataset(
         counts=c_map2,
         models=[background_model2],
-        exposure=get_exposure(geom_etrue),
+        exposure=get_exposure(geom_etrue, aeff),
         mask_safe=mask2,
         name="dataset-2",
     )
     dataset1.stack(dataset2)
     assert_allclose(dataset1.counts.data.sum(), 7987)
     assert_allclose(dataset1.background_model.map.data.sum(), 5987)
-    assert_allclose(dataset1.exposure.data, 2.0 * dataset2.exposure.data)
+    assert_allclose(dataset1.exposure.data / dataset2.exposure.data, 2.0)
     assert_allclose(dataset1.mask_safe.data.sum(), 20000)
 
 
-def to_cube(image):
-    # introduce a fake enery axis for now
-    axis = MapAxis.from_edges([1, 10] * u.TeV, name="energy")
-    geom = image.geom.to_cube([axis])
-    return WcsNDMap.from_geom(geom=geom, data=image.data)
+def to_cube(image, geom):
+    return WcsNDMap(geom, data=image.data[np.newaxis])
 
 
 @pytest.fixture
 def images():
     """Load some `counts`, `counts_off`, `acceptance_on`, `acceptance_off" images"""
     filename = "$GAMMAPY_DATA/tests/unbundled/hess/survey/hess_survey_snippet.fits.gz"
+    counts = WcsNDMap.read(filename, hdu="ON")
+
+    # introduce a fake enery axis for now, all images share the same geom
+    axis = MapAxis.from_edges(u.Quantity([1, 10], u.TeV, copy=False), name="energy")
+    geom = counts.geom.to_cube([axis])
+
     return {
-        "counts": to_cube(WcsNDMap.read(filename, hdu="ON")),
-        "counts_off": to_cube(WcsNDMap.read(filename, hdu="OFF")),
-        "acceptance": to_cube(WcsNDMap.read(filename, hdu="ONEXPOSURE")),
-        "acceptance_off": to_cube(WcsNDMap.read(filename, hdu="OFFEXPOSURE")),
-        "exposure": to_cube(WcsNDMap.read(filename, hdu="EXPGAMMAMAP")),
-        "background": to_cube(WcsNDMap.read(filename, hdu="BACKGROUND")),
+        "counts": to_cube(counts, geom),
+        "counts_off": to_cube(WcsNDMap.read(filename, hdu="OFF"), geom),
+        "acceptance": to_cube(WcsNDMap.read(filename, hdu="ONEXPOSURE"), geom),
+        "acceptance_off": to_cube(WcsNDMap.read(filename, hdu="OFFEXPOSURE"), geom),
+        "exposure": to_cube(WcsNDMap.read(filename, hdu="EXPGAMMAMAP"), geom),
+        "background": to_cube(WcsNDMap.read(filename, hdu="BACKGROUND"), geom),
     }
 
 
 def get_map_dataset_onoff(images, **kwargs):
     """Returns a MapDatasetOnOff"""
     mask_geom = images["counts"].geom
-    mask_data = np.ones(images["counts"].data.shape, dtype=bool)
+    mask_data = np.ones(mask_geom.data_shape, dtype=bool)
     mask_safe = Map.from_geom(mask_geom, data=mask_data)
 
     return MapDatasetOnOff(
@@ -555,11 +577,15 @@ def get_map_dataset_onoff(images, **kwargs):
 @requires_data()
 def test_map_dataset_on_off_fits_io(images, tmp_path):
     dataset = get_map_dataset_onoff(images)
-    gti = GTI.create([0 * u.s], [1 * u.h], reference_time="2010-01-01T00:00:00")
+    gti = GTI.create(
+        u.Quantity([0], u.s, copy=False),
+        u.Quantity([1], u.h, copy=False),
+        reference_time="2010-01-01T00:00:00",
+    )
     dataset.gti = gti
 
     hdulist = dataset.to_hdulist()
-    actual = [hdu.name for hdu in hdulist]
+    actual = list(map(attrgetter("name"), hdulist))
 
     desired = [
         "PRIMARY",
@@ -601,7 +627,7 @@ def test_map_dataset_on_off_fits_io(images, tmp_path):
     )
 
 
-def test_create_onoff(geom, geom_etrue):
+def test_create_onoff(geom):
     # tests empty datasets created
 
     migra_axis = MapAxis(nodes=np.linspace(0.0, 3.0, 51), unit="", name="migra")
@@ -623,7 +649,7 @@ def test_create_onoff(geom, geom_etrue):
 
     assert_allclose(empty_dataset.edisp.edisp_map.data.sum(), 200)
 
-    assert_allclose(empty_dataset.gti.time_delta, 0.0 * u.s)
+    assert_allclose(empty_dataset.gti.time_delta.to_value("s"), 0.0)
 
 
 @requires_data()
@@ -657,10 +683,16 @@ def test_stack_onoff(images, geom_image):
 def test_stack_onoff_cutout(geom_image):
     # Test stacking of cutouts
     dataset = MapDatasetOnOff.create(geom_image)
-    gti = GTI.create([0 * u.s], [1 * u.h], reference_time="2010-01-01T00:00:00")
+    gti = GTI.create(
+        u.Quantity([0], u.s, copy=False),
+        u.Quantity([1], u.h, copy=False),
+        reference_time="2010-01-01T00:00:00",
+    )
     dataset.gti = gti
 
-    geom_cutout = geom_image.cutout(position=geom_image.center_skydir, width=1 * u.deg)
+    geom_cutout = geom_image.cutout(
+        position=geom_image.center_skydir, width=u.Quantity(1, u.deg, copy=False)
+    )
     dataset_cutout = dataset.create(geom_cutout)
 
     dataset.stack(dataset_cutout)
@@ -691,18 +723,24 @@ def test_datasets_io_no_model(tmpdir):
 
 @requires_data()
 def test_map_dataset_on_off_to_spectrum_dataset(images):
-    e_reco = MapAxis.from_bounds(0.1, 10.0, 1, name="energy", unit=u.TeV, interp="log")
-    new_images = dict()
-    for key, image in images.items():
-        new_images[key] = Map.from_geom(
-            image.geom.to_cube([e_reco]), data=image.data[np.newaxis, :, :]
-        )
+    e_reco = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=1)
+    # all images share the same geom
+    geom = images["counts"].geom.to_cube([e_reco])
+    new_images = {
+        key: Map.from_geom(geom, data=image.data[np.newaxis, :, :])
+        for key, image in images.items()
+    }
     dataset = get_map_dataset_onoff(new_images)
-    gti = GTI.create([0 * u.s], [1 * u.h], reference_time="2010-01-01T00:00:00")
+    gti = GTI.create(
+        u.Quantity([0], u.s, copy=False),
+        u.Quantity([1], u.h, copy=False),
+        reference_time="2010-01-01T00:00:00",
+    )
     dataset.gti = gti
 
     on_region = CircleSkyRegion(
-        center=dataset.counts.geom.center_skydir, radius=0.1 * u.deg
+        center=dataset.counts.geom.center_skydir,
+        radius=u.Quantity(0.1, u.deg, copy=False),
     )
     spectrum_dataset = dataset.to_spectrum_dataset(on_region)
 
@@ -723,7 +761,11 @@ def test_map_dataset_on_off_to_spectrum_dataset(images):
 @requires_data()
 def test_map_dataset_on_off_cutout(images):
     dataset = get_map_dataset_onoff(images)
-    gti = GTI.create([0 * u.s], [1 * u.h], reference_time="2010-01-01T00:00:00")
+    gti = GTI.create(
+        u.Quantity([0], u.s, copy=False),
+        u.Quantity([1], u.h, copy=False),
+        reference_time="2010-01-01T00:00:00",
+    )
     dataset.gti = gti
 
     cutout_dataset = dataset.cutout(
@@ -743,11 +785,12 @@ def test_map_dataset_on_off_to_image():
     axis = MapAxis.from_energy_bounds(1, 10, 2, unit="TeV")
     geom = WcsGeom.create(npix=(10, 10), binsz=0.05, axes=[axis])
 
-    counts = Map.from_geom(geom, data=np.ones((2, 10, 10)))
-    counts_off = Map.from_geom(geom, data=np.ones((2, 10, 10)))
-    acceptance = Map.from_geom(geom, data=np.ones((2, 10, 10)))
-    acceptance_off = Map.from_geom(geom, data=np.ones((2, 10, 10)))
-    acceptance_off *= 2
+    # read-only data shared by the maps that are not modified
+    ones = np.broadcast_to(1.0, geom.data_shape)
+    counts = Map.from_geom(geom, data=ones)
+    counts_off = Map.from_geom(geom, data=ones)
+    acceptance = Map.from_geom(geom, data=ones)
+    acceptance_off = Map.from_geom(geom, data=np.full(geom.data_shape, 2.0))
 
     dataset = MapDatasetOnOff(
         counts=counts,
@@ -793,15 +836,12 @@ def test_map_dataset_geom(geom, sky_model):
 
 
 @requires_data()
-def test_names(geom, geom_etrue, sky_model):
-
-    m = Map.from_geom(geom)
-    m.quantity = 0.2 * np.ones(m.data.shape)
-    background_model1 = BackgroundModel(m, name="bkg1", datasets_names=["test"])
+def test_names(geom, geom_etrue, sky_model, aeff, bkg_map):
+    background_model1 = BackgroundModel(bkg_map, name="bkg1", datasets_names=["test"])
     assert background_model1.name == "bkg1"
 
     c_map1 = Map.from_geom(geom)
-    c_map1.quantity = 0.3 * np.ones(c_map1.data.shape)
+    c_map1.quantity = np.full(c_map1.data.shape, 0.3)
 
     model1 = sky_model.copy()
     assert model1.name != sky_model.name
@@ -812,7 +852,7 @@ def test_names(geom, geom_etrue, sky_model):
     dataset1 = MapDataset(
         counts=c_map1,
         models=Models([model1, model2, background_model1]),
-        exposure=get_exposure(geom_etrue),
+        exposure=get_exposure(geom_etrue, aeff),
         name="test",
     )
 
@@ -828,10 +868,10 @@ def test_names(geom, geom_etrue, sky_model):
 
 
 def test_stack_dataset_dataset_on_off():
-    axis = MapAxis.from_edges([1, 10] * u.TeV, name="energy")
+    axis = MapAxis.from_edges(u.Quantity([1, 10], u.TeV, copy=False), name="energy")
     geom = WcsGeom.create(width=1, axes=[axis])
 
-    gti = GTI.create([0 * u.s], [1 * u.h])
+    gti = GTI.create(u.Quantity([0], u.s, copy=False), u.Quantity([1], u.h, copy=False))
 
     dataset = MapDataset.create(geom, gti=gti)
     dataset_on_off = MapDatasetOnOff.create(geom, gti=gti)
@@ -22,7 +22,7 @@ from gammapy.utils.testing import requires_data
 
 
 @pytest.fixture(scope="session")
-def dataset():
+def dataset(aeff, psf_map):
     position = SkyCoord(0.0, 0.0, frame="galactic", unit="deg")
     energy_axis = MapAxis.from_bounds(
         1, 10, nbin=3, unit="TeV", name="energy", interp="log"
@@ -64,7 +64,12 @@ def dataset():
     geom_true.axes[0].name = "energy_true"
 
     dataset = get_map_dataset(
-        sky_model=skymodel, geom=geom, geom_etrue=geom_true, edisp=True
+        sky_model=skymodel,
+        geom=geom,
+        geom_etrue=geom_true,
+        aeff=aeff,
+        psf_map=psf_map,
+        edisp=True,
     )
     dataset.gti = gti
 
@@ -1,9 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import sys
 import setuptools
-from distutils.version import LooseVersion
 
-if LooseVersion(setuptools.__version__) < "30.3":
+if tuple(int(_) for _ in setuptools.__version__.split(".")[:2]) < (30, 3):
     sys.stderr.write("ERROR: setuptools 30.3 or later is required by gammapy\n")
     sys.exit(1)
 
@@ -11,23 +10,40 @@ if LooseVersion(setuptools.__version__) < "30.3":
 # Exit with good error message telling people to install those first if not
 
 
-from Cython.Build import cythonize
-from distutils.extension import Extension
-import numpy as np
-
-
 def make_cython_extension(filename):
-    return Extension(
+    import numpy as np
+
+    return setuptools.Extension(
         filename.strip(".pyx").replace("/", "."),
         [filename],
         include_dirs=[np.get_include()],
     )
 
 
+def make_ext_modules(filenames):
+    from Cython.Build import cythonize
+
+    return cythonize([make_cython_extension(_) for _ in filenames])
+
+
+def is_display_only(args):
+    """Check if only metadata or help should be shown, e.g. ``--version``.
+
+    These invocations don't build anything, so the Cython and Numpy
+    imports needed for the extension modules can be skipped.
+    """
+    names = setuptools.dist.Distribution.display_option_names
+    options = {"--help", "-h"} | {"--" + _.replace("_", "-") for _ in names}
+    return not options.isdisjoint(args)
+
+
 cython_files = [
     "gammapy/stats/fit_statistics_cython.pyx",
 ]
 
-ext_modules = cythonize([make_cython_extension(_) for _ in cython_files])
+if is_display_only(sys.argv[1:]):
+    ext_modules = []
+else:
+    ext_modules = make_ext_modules(cython_files)
 
 setuptools.setup(use_scm_version=True, ext_modules=ext_modules)